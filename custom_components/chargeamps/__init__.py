@@ -5,7 +5,10 @@ For more details about this component, please refer to
 https://github.com/kirei/hass-chargeamps
 """
 
+import asyncio
+import copy
 import logging
+import time
 from datetime import timedelta
 from typing import Optional
 
@@ -18,9 +21,16 @@ from chargeamps.base import (
     ChargePointConnectorSettings,
 )
 from chargeamps.external import ChargeAmpsExternalClient
-from homeassistant.const import CONF_API_KEY, CONF_PASSWORD, CONF_URL, CONF_USERNAME
+from homeassistant.const import (
+    CONF_API_KEY,
+    CONF_PASSWORD,
+    CONF_URL,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_STOP,
+)
 from homeassistant.helpers import discovery
-from homeassistant.util import Throttle
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 
 from .const import (
     CONF_CHARGEPOINTS,
@@ -29,9 +39,12 @@ from .const import (
     DOMAIN_DATA,
     PLATFORMS,
     DIMMER_VALUES,
+    SIGNAL_UPDATE_CHARGEAMPS,
 )
 
 MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=30)
+MAX_SETTINGS_AGE = timedelta(seconds=60)
+SETUP_PROBE_TIMEOUT = timedelta(seconds=10)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,19 +89,37 @@ async def async_setup(hass, config):
     charge_point_ids = config[DOMAIN].get(CONF_CHARGEPOINTS)
     readonly = config[DOMAIN].get(CONF_READONLY, False)
 
-    # Configure the client.
+    # Configure the client, its HTTP session is shared by all requests.
     client = ChargeAmpsExternalClient(
         email=username, password=password, api_key=api_key, api_base_url=api_base_url
     )
 
+    async def shutdown_client(event):  # pylint: disable=unused-argument
+        await client.shutdown()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, shutdown_client)
+
     # check all configured chargepoints or discover
     if charge_point_ids is not None:
-        for cp_id in charge_point_ids:
-            try:
-                await client.get_chargepoint_status(cp_id)
-                _LOGGER.info("Adding chargepoint %s", cp_id)
-            except Exception:
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(
+                        client.get_chargepoint_status(cp_id)
+                        for cp_id in charge_point_ids
+                    ),
+                    return_exceptions=True,
+                ),
+                SETUP_PROBE_TIMEOUT.total_seconds(),
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Timeout checking chargepoints, adding them unchecked")
+            results = [None] * len(charge_point_ids)
+        for cp_id, result in zip(charge_point_ids, results):
+            if isinstance(result, Exception):
                 _LOGGER.error("Error adding chargepoint %s", cp_id)
+            else:
+                _LOGGER.info("Adding chargepoint %s", cp_id)
         if len(charge_point_ids) == 0:
             _LOGGER.error("No chargepoints found")
             return False
@@ -106,15 +137,14 @@ async def async_setup(hass, config):
     hass.data[DOMAIN_DATA]["connector_status"] = {}
     hass.data[DOMAIN_DATA]["connector_settings"] = {}
     await handler.update_info()
+    await handler.async_update_all()
+    async_track_time_interval(hass, handler.async_update_all, MIN_TIME_BETWEEN_UPDATES)
 
     # Register services to hass
-    async def execute_service(call):
-        function_name = _SERVICE_MAP[call.service]
-        function_call = getattr(handler, function_name)
-        await function_call(call.data)
-
-    for service in _SERVICE_MAP:
-        hass.services.async_register(DOMAIN, service, execute_service)
+    for service, function_name in _SERVICE_MAP.items():
+        hass.services.async_register(
+            DOMAIN, service, _service_handler(getattr(handler, function_name))
+        )
 
     # Load platforms
     for domain in PLATFORMS:
@@ -125,6 +155,15 @@ async def async_setup(hass, config):
     return True
 
 
+def _service_handler(function_call):
+    """Return a service handler calling a bound handler method."""
+
+    async def execute_service(call):
+        await function_call(call.data)
+
+    return execute_service
+
+
 class ChargeampsHandler:
     """This class handle communication and stores the data."""
 
@@ -136,15 +175,29 @@ class ChargeampsHandler:
         self.default_charge_point_id = charge_point_ids[0]
         self.default_connector_id = 1
         self.readonly = readonly
+        self._pending = {}
+        self._settings_updated = {}
         if self.readonly:
             _LOGGER.warning(
                 "Running in read-only mode, chargepoint will never be updated"
             )
 
     async def get_chargepoint_statuses(self):
+        results = await asyncio.gather(
+            *(
+                self.client.get_chargepoint_status(cp_id)
+                for cp_id in self.charge_point_ids
+            ),
+            return_exceptions=True,
+        )
         res = []
-        for cp_id in self.charge_point_ids:
-            res.append(await self.client.get_chargepoint_status(cp_id))
+        for cp_id, result in zip(self.charge_point_ids, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Could not get status for chargepoint %s - %s", cp_id, result
+                )
+            else:
+                res.append(result)
         return res
 
     def get_chargepoint_info(self, charge_point_id) -> ChargePoint:
@@ -170,8 +223,18 @@ class ChargeampsHandler:
     def get_connector_status(
         self, charge_point_id, connector_id
     ) -> Optional[ChargePointConnectorStatus]:
-        key = (charge_point_id, connector_id)
-        return self.hass.data[DOMAIN_DATA]["connector_status"].get(key)
+        statuses = self.hass.data[DOMAIN_DATA]["connector_status"].get(
+            charge_point_id, []
+        )
+        # connectors are normally listed in order, starting at 1
+        if 0 < connector_id <= len(statuses):
+            status = statuses[connector_id - 1]
+            if status.connector_id == connector_id:
+                return status
+        for status in statuses:
+            if status.connector_id == connector_id:
+                return status
+        return None
 
     def get_connector_settings(
         self, charge_point_id, connector_id
@@ -179,30 +242,53 @@ class ChargeampsHandler:
         key = (charge_point_id, connector_id)
         return self.hass.data[DOMAIN_DATA]["connector_settings"].get(key)
 
-    async def set_connector_mode(self, charge_point_id, connector_id, mode):
-        settings = await self.client.get_chargepoint_connector_settings(
-            charge_point_id, connector_id
-        )
-        settings.mode = mode
+    def _store_connector_settings(self, charge_point_id, connector_id, settings):
+        key = (charge_point_id, connector_id)
+        self.hass.data[DOMAIN_DATA]["connector_settings"][key] = settings
+        self._settings_updated[key] = time.monotonic()
+
+    async def _get_connector_settings_for_update(self, charge_point_id, connector_id):
+        """Return a copy of the connector settings, fetched only if stale."""
+        key = (charge_point_id, connector_id)
+        settings = self.get_connector_settings(charge_point_id, connector_id)
+        updated = self._settings_updated.get(key)
+        if (
+            settings is None
+            or updated is None
+            or time.monotonic() - updated > MAX_SETTINGS_AGE.total_seconds()
+        ):
+            settings = await self.client.get_chargepoint_connector_settings(
+                charge_point_id, connector_id
+            )
+            self._store_connector_settings(charge_point_id, connector_id, settings)
+        return copy.copy(settings)
+
+    async def _set_connector_settings(self, settings):
         if self.readonly:
             _LOGGER.info("NOT setting chargepoint connector: %s", settings)
         else:
             _LOGGER.info("Setting chargepoint connector: %s", settings)
             await self.client.set_chargepoint_connector_settings(settings)
+            self._store_connector_settings(
+                settings.charge_point_id, settings.connector_id, settings
+            )
+
+    async def set_connector_mode(self, charge_point_id, connector_id, mode):
+        settings = await self._get_connector_settings_for_update(
+            charge_point_id, connector_id
+        )
+        settings.mode = mode
+        await self._set_connector_settings(settings)
         await self.force_update_data(charge_point_id)
 
     async def set_connector_max_current(
         self, charge_point_id, connector_id, max_current
     ):
-        settings = await self.client.get_chargepoint_connector_settings(
+        settings = await self._get_connector_settings_for_update(
             charge_point_id, connector_id
         )
         settings.max_current = max_current
-        if self.readonly:
-            _LOGGER.info("NOT setting chargepoint connector: %s", settings)
-        else:
-            _LOGGER.info("Setting chargepoint connector: %s", settings)
-            await self.client.set_chargepoint_connector_settings(settings)
+        await self._set_connector_settings(settings)
         await self.force_update_data(charge_point_id)
 
     async def update_info(self):
@@ -216,14 +302,29 @@ class ChargeampsHandler:
                 _LOGGER.debug("CONNECTOR INFO = %s", c)
                 _LOGGER.info("Update info for chargepoint %s", cp.id)
 
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
+    async def async_update_all(self, now=None):  # pylint: disable=unused-argument
+        """Update data for all chargepoints and notify entities."""
+        await asyncio.gather(
+            *(self.update_data(cp_id) for cp_id in self.charge_point_ids)
+        )
+        async_dispatcher_send(self.hass, SIGNAL_UPDATE_CHARGEAMPS)
+
     async def update_data(self, charge_point_id):
-        _LOGGER.debug("Update data for chargepoint %s", charge_point_id)
-        await self._update_data(charge_point_id)
+        """Update data, shared between concurrent callers."""
+        pending = self._pending.get(charge_point_id)
+        if pending is None:
+            _LOGGER.debug("Update data for chargepoint %s", charge_point_id)
+            pending = self.hass.async_create_task(self._update_data(charge_point_id))
+            self._pending[charge_point_id] = pending
+            pending.add_done_callback(
+                lambda _: self._pending.pop(charge_point_id, None)
+            )
+        await asyncio.shield(pending)
 
     async def force_update_data(self, charge_point_id):
         _LOGGER.debug("Force update data for chargepoint %s", charge_point_id)
         await self._update_data(charge_point_id)
+        async_dispatcher_send(self.hass, SIGNAL_UPDATE_CHARGEAMPS)
 
     async def _update_data(self, charge_point_id):
         """Update data."""
@@ -231,20 +332,23 @@ class ChargeampsHandler:
             status = await self.client.get_chargepoint_status(charge_point_id)
             _LOGGER.debug("STATUS = %s", status)
             self.hass.data[DOMAIN_DATA]["chargepoint_status"][charge_point_id] = status
-            for connector_status in status.connector_statuses:
-                _LOGGER.debug(
-                    "Update data for chargepoint %s connector %d",
-                    charge_point_id,
-                    connector_status.connector_id,
+            self.hass.data[DOMAIN_DATA]["connector_status"][
+                charge_point_id
+            ] = status.connector_statuses
+            all_settings = await asyncio.gather(
+                *(
+                    self.client.get_chargepoint_connector_settings(
+                        charge_point_id, connector_status.connector_id
+                    )
+                    for connector_status in status.connector_statuses
                 )
-                key = (charge_point_id, connector_status.connector_id)
-                self.hass.data[DOMAIN_DATA]["connector_status"][key] = connector_status
-                connector_settings = await self.client.get_chargepoint_connector_settings(
-                    charge_point_id, connector_status.connector_id
+            )
+            for connector_status, connector_settings in zip(
+                status.connector_statuses, all_settings
+            ):
+                self._store_connector_settings(
+                    charge_point_id, connector_status.connector_id, connector_settings
                 )
-                self.hass.data[DOMAIN_DATA]["connector_settings"][
-                    key
-                ] = connector_settings
         except Exception as error:  # pylint: disable=broad-except
             _LOGGER.error("Could not update data - %s", error)
 
@@ -6,6 +6,9 @@ VERSION = "1.0.0"
 PLATFORMS = ["sensor", "switch"]
 ISSUE_URL = "https://github.com/kirei/hass-chargeamps/issues"
 
+# Dispatcher signals
+SIGNAL_UPDATE_CHARGEAMPS = f"{DOMAIN}_update"
+
 # Icons
 ICON = "mdi:car-connected"
 
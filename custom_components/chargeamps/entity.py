@@ -0,0 +1,74 @@
+"""Base entity for Chargeamps."""
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .const import DOMAIN, DOMAIN_DATA, ICON, SIGNAL_UPDATE_CHARGEAMPS
+
+
+class ChargeampsEntity(Entity):
+    """Chargeamps Entity class."""
+
+    def __init__(self, hass, name, charge_point_id, connector_id):
+        self.hass = hass
+        self.charge_point_id = charge_point_id
+        self.connector_id = connector_id
+        self.handler = self.hass.data[DOMAIN_DATA]["handler"]
+        self._chargepoint_info = self.handler.get_chargepoint_info(charge_point_id)
+        self._connector_info = self.handler.get_connector_info(
+            charge_point_id, connector_id
+        )
+        self._name = name
+        self._unique_id = f"{DOMAIN}_{charge_point_id}_{connector_id}"
+        self._icon = ICON
+        self._attributes = {}
+        self._unsub_dispatcher = None
+
+    def update_from_data(self):
+        """Update the entity from the handler data, return True if changed."""
+        raise NotImplementedError
+
+    async def async_added_to_hass(self):
+        """Register for updates from the handler."""
+        self.update_from_data()
+        self._unsub_dispatcher = async_dispatcher_connect(
+            self.hass, SIGNAL_UPDATE_CHARGEAMPS, self._handle_update
+        )
+
+    async def async_will_remove_from_hass(self):
+        """Unregister from updates from the handler."""
+        if self._unsub_dispatcher is not None:
+            self._unsub_dispatcher()
+            self._unsub_dispatcher = None
+
+    @callback
+    def _handle_update(self):
+        """Handle updated data from the handler."""
+        if self.update_from_data():
+            self.async_schedule_update_ha_state()
+
+    @property
+    def should_poll(self):
+        """No polling needed, the handler pushes updates."""
+        return False
+
+    @property
+    def name(self):
+        """Return the name of the entity."""
+        return self._name
+
+    @property
+    def icon(self):
+        """Icon to use in the frontend, if any."""
+        return self._icon
+
+    @property
+    def device_state_attributes(self):
+        """Return the state attributes of the entity."""
+        return self._attributes
+
+    @property
+    def unique_id(self):
+        """Return a unique ID to use for this entity."""
+        return self._unique_id
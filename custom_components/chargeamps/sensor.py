@@ -2,9 +2,8 @@
 
 import logging
 
-from homeassistant.helpers.entity import Entity
-
-from .const import DOMAIN, DOMAIN_DATA, ICON
+from .const import DOMAIN_DATA
+from .entity import ChargeampsEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,78 +30,36 @@ async def async_setup_platform(
                 connector.charge_point_id,
                 connector.connector_id,
             )
-    async_add_entities(sensors, True)
+    async_add_entities(sensors)
 
 
-class ChargeampsSensor(Entity):
+class ChargeampsSensor(ChargeampsEntity):
     """Chargeamps Sensor class."""
 
     def __init__(self, hass, name, charge_point_id, connector_id):
-        self.hass = hass
-        self.charge_point_id = charge_point_id
-        self.connector_id = connector_id
-        self.handler = self.hass.data[DOMAIN_DATA]["handler"]
-        self._name = name
-        self._icon = ICON
+        super().__init__(hass, name, charge_point_id, connector_id)
         self._state = None
-        self._attributes = {}
-        self._interviewed = False
-
-    async def interview(self):
-        chargepoint_info = self.handler.get_chargepoint_info(self.charge_point_id)
-        connector_info = self.handler.get_connector_info(
-            self.charge_point_id, self.connector_id
-        )
-        self._attributes["chargepoint_type"] = chargepoint_info.type
-        self._attributes["connector_type"] = connector_info.type
-        self._interviewed = True
+        self._attributes["chargepoint_type"] = self._chargepoint_info.type
+        self._attributes["connector_type"] = self._connector_info.type
 
-    async def async_update(self):
+    def update_from_data(self):
         """Update the sensor."""
-        _LOGGER.debug(
-            "Update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
-        await self.handler.update_data(self.charge_point_id)
-        _LOGGER.debug(
-            "Finished update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
         status = self.handler.get_connector_status(
             self.charge_point_id, self.connector_id
         )
         if status is None:
-            return
+            return False
+        total_consumption_kwh = round(status.total_consumption_kwh, 3)
+        if (
+            status.status == self._state
+            and total_consumption_kwh == self._attributes.get("total_consumption_kwh")
+        ):
+            return False
         self._state = status.status
-        self._attributes["total_consumption_kwh"] = round(
-            status.total_consumption_kwh, 3
-        )
-        if not self._interviewed:
-            await self.interview()
-
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return self._name
-
-    @property
-    def icon(self):
-        """Icon to use in the frontend, if any."""
-        return self._icon
+        self._attributes["total_consumption_kwh"] = total_consumption_kwh
+        return True
 
     @property
     def state(self):
         """Return the state of the sensor."""
         return self._state
-
-    @property
-    def device_state_attributes(self):
-        """Return the state attributes of the sensor."""
-        return self._attributes
-
-    @property
-    def unique_id(self):
-        """Return a unique ID to use for this sensor."""
-        return f"{DOMAIN}_{self.charge_point_id}_{self.connector_id}"
@@ -4,7 +4,8 @@ import logging
 
 from homeassistant.components.switch import SwitchDevice
 
-from .const import DOMAIN, DOMAIN_DATA, ICON
+from .const import DOMAIN_DATA
+from .entity import ChargeampsEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,49 +32,37 @@ async def async_setup_platform(
                 connector.charge_point_id,
                 connector.connector_id,
             )
-    async_add_entities(switches, True)
+    async_add_entities(switches)
 
 
-class ChargeampsSwitch(SwitchDevice):
+class ChargeampsSwitch(ChargeampsEntity, SwitchDevice):
     """Chargeamps Switch class."""
 
     def __init__(self, hass, name, charge_point_id, connector_id):
-        self.hass = hass
-        self.charge_point_id = charge_point_id
-        self.connector_id = connector_id
-        self.handler = self.hass.data[DOMAIN_DATA]["handler"]
-        self._name = name
-        self._icon = ICON
-        self._attributes = {}
+        super().__init__(hass, name, charge_point_id, connector_id)
         self._status = None
 
-    async def async_update(self):
+    def update_from_data(self):
         """Update the switch."""
-        _LOGGER.debug(
-            "Update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
-        await self.handler.update_data(self.charge_point_id)
-        _LOGGER.debug(
-            "Finished update chargepoint %s connector %s",
-            self.charge_point_id,
-            self.connector_id,
-        )
         settings = self.handler.get_connector_settings(
             self.charge_point_id, self.connector_id
         )
         if settings is None:
-            return
+            return False
         if settings.mode == "On":
-            self._status = True
+            status = True
         elif settings.mode == "Off":
-            self._status = False
+            status = False
         else:
-            self._status = None
-        self._attributes["max_current"] = (
-            round(settings.max_current) if settings.max_current else None
-        )
+            status = None
+        max_current = round(settings.max_current) if settings.max_current else None
+        if status == self._status and max_current == self._attributes.get(
+            "max_current"
+        ):
+            return False
+        self._status = status
+        self._attributes["max_current"] = max_current
+        return True
 
     async def async_turn_on(self, **kwargs):  # pylint: disable=unused-argument
         """Turn on the switch."""
@@ -91,23 +80,3 @@ class ChargeampsSwitch(SwitchDevice):
     def is_on(self):
         """Return true if the switch is on."""
         return self._status
-
-    @property
-    def name(self):
-        """Return the name of the switch."""
-        return self._name
-
-    @property
-    def icon(self):
-        """Icon to use in the frontend, if any."""
-        return self._icon
-
-    @property
-    def device_state_attributes(self):
-        """Return the state attributes of the switch."""
-        return self._attributes
-
-    @property
-    def unique_id(self):
-        """Return a unique ID to use for this switch."""
-        return f"{DOMAIN}_{self.charge_point_id}_{self.connector_id}"